@@ -2,10 +2,12 @@
 Generate graphs with various properties, including trees.
 """
 
+import heapq
 import math
 import random
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
+from radge.polygon import Vector
 import radge.utils as utils
 
 class Edge:
@@ -259,3 +261,315 @@ def dag(
         if not multi_edges:  # if there are mutliedges then we don't care about the set
             edges_set.add((u, v))
     return graph
+
+
+def grid_graph(
+    row_cnt: int, col_cnt: int, weight_func: Optional[Callable[[], int]] = None
+) -> Graph:
+    """Return a grid graph with row_cnt * col_cnt vertices, each connected to its (up to) 4 neighbours."""
+    graph = Graph(row_cnt * col_cnt, weight_func=weight_func)
+    for i in range(row_cnt):
+        for j in range(col_cnt):
+            v = i * col_cnt + j + 1
+            if j + 1 < col_cnt:
+                graph.add_edge(v, v + 1)
+            if i + 1 < row_cnt:
+                graph.add_edge(v, v + col_cnt)
+
+    return graph
+
+
+def _coords(vertex_cnt: int, points: Optional[List[Vector]]) -> Tuple[List[int], List[int]]:
+    """Return the coordinates of given points, or of vertex_cnt random points if none are given.
+    Random coords are in [-C, C], where C = max(MAX_COORD, vertex_cnt), so that few points coincide."""
+    if points is not None:
+        if len(points) != vertex_cnt:
+            raise ValueError("the number of points must be equal to vertex_cnt")
+        return [p.x for p in points], [p.y for p in points]
+    c = max(utils.MAX_COORD, vertex_cnt)
+    xs = [random.randint(-c, c) for _ in range(vertex_cnt)]
+    ys = [random.randint(-c, c) for _ in range(vertex_cnt)]
+    return xs, ys
+
+
+def _buckets(xs: List[int], ys: List[int], cell: int) -> Dict[Tuple[int, int], List[int]]:
+    """Spatial index: map each grid cell of side cell to the (0-indexed) points inside it."""
+    buckets = {}
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        buckets.setdefault((x // cell, y // cell), []).append(i)
+    return buckets
+
+
+def _kd_tree(xs: List[int], ys: List[int], leaf_size: int) -> Tuple[List[int], List[List[int]]]:
+    """Spatial index which adapts to the distribution of the points (unlike a grid of fixed cells).
+    Return the (0-indexed) points reordered so that each node covers a contiguous slice of them,
+    and the nodes as [lo, hi, min_x, max_x, min_y, max_y, left, right] (children are -1 in leaves).
+    Node 0 is the root."""
+    order = list(range(len(xs)))
+    nodes = []
+
+    def new_node(lo: int, hi: int) -> int:
+        node_xs, node_ys = [xs[j] for j in order[lo:hi]], [ys[j] for j in order[lo:hi]]
+        nodes.append([lo, hi, min(node_xs), max(node_xs), min(node_ys), max(node_ys), -1, -1])
+        return len(nodes) - 1
+
+    stack = [new_node(0, len(xs))]
+    while stack:
+        v = stack.pop()
+        lo, hi, min_x, max_x, min_y, max_y, _, _ = nodes[v]
+        if hi - lo <= leaf_size:
+            continue
+        # split at the median of the wider side (duplicate points are split too)
+        key = xs if max_x - min_x >= max_y - min_y else ys
+        order[lo:hi] = sorted(order[lo:hi], key=key.__getitem__)
+        mid = (lo + hi) // 2
+        nodes[v][6], nodes[v][7] = new_node(lo, mid), new_node(mid, hi)
+        stack += [nodes[v][6], nodes[v][7]]
+
+    return order, nodes
+
+
+def unit_disk_graph(
+    vertex_cnt: int,
+    radius: int,
+    weight_func: Optional[Callable[[], int]] = None,
+    points: Optional[List[Vector]] = None,
+) -> Graph:
+    """Return a graph on vertex_cnt points, in which two vertices are connected iff the distance
+    between their points is at most radius. Unless given, the points are random, with coords
+    in [-C, C], where C = max(MAX_COORD, vertex_cnt)."""
+    if radius < 0:
+        raise ValueError("radius must be non-negative")
+    graph = Graph(vertex_cnt, weight_func=weight_func)
+    xs, ys = _coords(vertex_cnt, points)
+    cell = max(radius, 1)
+    buckets = _buckets(xs, ys, cell)
+    for (cx, cy), inside in buckets.items():
+        # every pair of cells is visited once: the cell itself and 4 of its 8 neighbours
+        for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+            other = buckets.get((cx + dx, cy + dy))
+            if other is None:
+                continue
+            for a, i in enumerate(inside):
+                for j in inside[a + 1 :] if dx == dy == 0 else other:
+                    if (xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2 <= radius**2:
+                        graph.add_edge(i + 1, j + 1)
+
+    return graph
+
+
+def knn_graph(
+    vertex_cnt: int,
+    k: int,
+    weight_func: Optional[Callable[[], int]] = None,
+    points: Optional[List[Vector]] = None,
+) -> Graph:
+    """Return a graph on vertex_cnt points, in which every vertex is connected to the vertices
+    of its k nearest points (ties broken arbitrarily). Unless given, the points are random,
+    with coords in [-C, C], where C = max(MAX_COORD, vertex_cnt)."""
+    if k < 1 or k >= vertex_cnt:
+        raise ValueError("k must be at least 1 and less than vertex_cnt")
+    graph = Graph(vertex_cnt, weight_func=weight_func)
+    xs, ys = _coords(vertex_cnt, points)
+    order, nodes = _kd_tree(xs, ys, max(2 * k, 8))
+    edges_set = set()
+    for i in range(vertex_cnt):
+        x, y = xs[i], ys[i]
+        # best-first search: nodes are visited in order of their distance from the point
+        nearest, queue = [], [(0, 0)]  # nearest is a max-heap of (-distance, vertex)
+        while queue:
+            dist, v = heapq.heappop(queue)
+            if len(nearest) == k and dist >= -nearest[0][0]:
+                break
+            lo, hi, _, _, _, _, left, right = nodes[v]
+            if left == -1:
+                for j in order[lo:hi]:
+                    if j == i:
+                        continue
+                    d = (x - xs[j]) ** 2 + (y - ys[j]) ** 2
+                    if len(nearest) < k:
+                        heapq.heappush(nearest, (-d, j))
+                    elif d < -nearest[0][0]:
+                        heapq.heapreplace(nearest, (-d, j))
+                continue
+            for child in (left, right):
+                _, _, min_x, max_x, min_y, max_y, _, _ = nodes[child]
+                dx, dy = max(min_x - x, 0, x - max_x), max(min_y - y, 0, y - max_y)
+                heapq.heappush(queue, (dx * dx + dy * dy, child))
+        for _, j in nearest:
+            if (min(i, j), max(i, j)) not in edges_set:
+                edges_set.add((min(i, j), max(i, j)))
+                graph.add_edge(i + 1, j + 1)
+
+    return graph
+
+
+def planar_graph(
+    vertex_cnt: int,
+    edge_cnt: int,
+    weight_func: Optional[Callable[[], int]] = None,
+    connected: bool = False,
+) -> Graph:
+    """Return a random planar graph with vertex_cnt vertices and edge_cnt edges.
+    Edges are picked from a triangulation of a grid (each cell split by a random diagonal)."""
+    col_cnt = max(1, math.isqrt(vertex_cnt))
+    graph = Graph(vertex_cnt, weight_func=weight_func)
+    cand = []
+    for v in range(1, vertex_cnt + 1):
+        right, down = v + 1 if v % col_cnt != 0 else 0, v + col_cnt
+        if right and right <= vertex_cnt:
+            cand.append((v, right))
+        if down <= vertex_cnt:
+            cand.append((v, down))
+        if right and down + 1 <= vertex_cnt:
+            cand.append((v, down + 1) if random.randint(0, 1) else (right, down))
+    if edge_cnt > len(cand):
+        raise ValueError(f"edge_cnt must not be more than {len(cand)} for vertex_cnt = {vertex_cnt}")
+    if edge_cnt < vertex_cnt - 1 and connected:
+        raise ValueError(
+            "edge_cnt must be at least vertex_cnt - 1 if the graph is to be connected."
+        )
+    random.shuffle(cand)
+    if connected:
+        # the edges of a random spanning tree go first (Kruskal's algorithm)
+        parent = list(range(vertex_cnt + 1))
+
+        def find(v: int) -> int:
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            return v
+
+        tree, rest = [], []
+        for u, v in cand:
+            if find(u) != find(v):
+                parent[find(u)] = find(v)
+                tree.append((u, v))
+            else:
+                rest.append((u, v))
+        cand = tree + rest
+    for u, v in cand[:edge_cnt]:
+        graph.add_edge(u, v)
+
+    return graph
+
+
+def is_graphical(degrees: List[int]) -> bool:
+    """Check if there exists a simple graph with the given degree sequence (Erdos-Gallai theorem)."""
+    d = sorted(degrees, reverse=True)
+    n = len(d)
+    if n == 0:
+        return True
+    if d[-1] < 0 or sum(d) % 2 == 1:
+        return False
+    suffix = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + d[i]
+    prefix, j = 0, n  # j is the number of degrees >= k
+    for k in range(1, n + 1):
+        prefix += d[k - 1]
+        while j > 0 and d[j - 1] < k:
+            j -= 1
+        # sum of min(d_i, k) over i > k
+        rest = k * max(0, j - k) + suffix[max(j, k)]
+        if prefix > k * (k - 1) + rest:
+            return False
+
+    return True
+
+
+def degree_sequence_graph(
+    degrees: List[int],
+    weight_func: Optional[Callable[[], int]] = None,
+    swap_cnt: Optional[int] = None,
+) -> Graph:
+    """Return a random simple graph in which vertex i has degree degrees[i - 1].
+    A graph is built with the Havel-Hakimi algorithm and then shuffled by swap_cnt
+    (by default 10 * edge_cnt) random degree-preserving edge switches."""
+    if not is_graphical(degrees):
+        raise ValueError("degrees must form a graphical sequence")
+    graph = Graph(len(degrees), weight_func=weight_func)
+    _add_degree_sequence(graph, degrees, swap_cnt)
+
+    return graph
+
+
+def _add_degree_sequence(graph: Graph, degrees: List[int], swap_cnt: Optional[int]) -> None:
+    """Add the edges of a random simple graph with the given (graphical) degree sequence to graph."""
+    vertex_cnt = len(degrees)
+    # Havel-Hakimi: connect the vertex of the largest degree to the ones with the next largest degrees
+    heap = [(-d, random.random(), v) for v, d in enumerate(degrees, 1) if d > 0]
+    heapq.heapify(heap)
+    edges = []
+    while heap:
+        d, _, u = heapq.heappop(heap)
+        taken = [heapq.heappop(heap) for _ in range(-d)]
+        for dv, key, v in taken:
+            edges.append((u, v))
+            if dv + 1 < 0:
+                heapq.heappush(heap, (dv + 1, key, v))
+
+    # an edge u-v is stored in the set as u * base + v, where u < v
+    base = vertex_cnt + 1
+    edges_set = set(min(u, v) * base + max(u, v) for u, v in edges)
+    if swap_cnt is None:
+        swap_cnt = 10 * len(edges)
+    edge_cnt, rand = len(edges), random.random
+    if edge_cnt >= 2:
+        for _ in range(swap_cnt):
+            # a-b, c-d becomes a-d, c-b
+            i, j = int(rand() * edge_cnt), int(rand() * edge_cnt)
+            (a, b), (c, d) = edges[i], edges[j]
+            if rand() < 0.5:
+                c, d = d, c
+            if a == d or c == b:
+                continue
+            ad = a * base + d if a < d else d * base + a
+            cb = c * base + b if c < b else b * base + c
+            if ad in edges_set or cb in edges_set:
+                continue
+            edges_set.remove(a * base + b if a < b else b * base + a)
+            edges_set.remove(c * base + d if c < d else d * base + c)
+            edges_set.add(ad)
+            edges_set.add(cb)
+            edges[i], edges[j] = (a, d), (c, b)
+
+    for u, v in edges:
+        graph.add_edge(u, v)
+
+
+def regular_graph(
+    vertex_cnt: int, degree: int, weight_func: Optional[Callable[[], int]] = None
+) -> Graph:
+    """Return a random simple graph with vertex_cnt vertices, each of degree degree."""
+    if degree >= vertex_cnt or vertex_cnt * degree % 2 == 1:
+        raise ValueError(
+            "degree must be less than vertex_cnt and vertex_cnt * degree must be even"
+        )
+    return degree_sequence_graph([degree] * vertex_cnt, weight_func=weight_func)
+
+
+def power_law_graph(
+    vertex_cnt: int,
+    exponent: float = 2.5,
+    max_degree: Optional[int] = None,
+    weight_func: Optional[Callable[[], int]] = None,
+) -> Graph:
+    """Return a random simple graph with vertex_cnt vertices, in which the fraction of vertices
+    of degree d (1 <= d <= max_degree, sqrt(vertex_cnt) by default) is proportional to d^(-exponent)."""
+    if max_degree is None:
+        max_degree = min(max(1, math.isqrt(vertex_cnt)), vertex_cnt - 1)
+    if max_degree < 0 or max_degree >= vertex_cnt:
+        raise ValueError("max_degree must be non-negative and less than vertex_cnt")
+    # the graph reseeds the RNG, so the degrees are drawn after creating it
+    graph = Graph(vertex_cnt, weight_func=weight_func)
+    if max_degree == 0:
+        return graph
+    weights = [d ** (-exponent) for d in range(1, max_degree + 1)]
+    while True:
+        degrees = random.choices(range(1, max_degree + 1), weights=weights, k=vertex_cnt)
+        if sum(degrees) % 2 == 1:
+            degrees[random.randrange(vertex_cnt)] -= 1
+        if is_graphical(degrees):
+            _add_degree_sequence(graph, degrees, None)
+            return graph
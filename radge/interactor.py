@@ -0,0 +1,207 @@
+"""
+Run interactive problems locally: a judge answers the queries of a contestant's program online.
+"""
+
+import abc
+import asyncio
+import time
+from typing import List, Optional
+
+import radge.graph as graph
+import radge.sequences as sequences
+import radge.string as string
+
+
+class WrongAnswer(Exception):
+    """Raised by an interactor when the contestant's query or answer is invalid."""
+
+
+def is_number(s: str) -> bool:
+    """Check if s is a non-negative integer written with ASCII digits."""
+    return s.isascii() and s.isdigit()
+
+
+class Result:
+    """Outcome of an interaction."""
+
+    def __init__(self, verdict: str, message: str, query_cnt: int, times: List[float]) -> None:
+        """Initialize a result."""
+        self.verdict = verdict  # one of OK, WA, QLE (query limit exceeded), TLE, RE (runtime error)
+        self.message = message
+        self.query_cnt = query_cnt
+        self.times = times  # seconds the contestant took to send each line
+
+    def __str__(self) -> str:
+        """Return the result as a string."""
+        return f"{self.verdict} ({self.query_cnt} queries, {sum(self.times):.3f}s)" + (
+            f": {self.message}" if self.message else ""
+        )
+
+
+class Interactor(abc.ABC):
+    """Judge of an interactive problem. Subclasses generate the hidden data and answer queries."""
+
+    def __init__(self, query_limit: Optional[int] = None, time_limit: Optional[float] = None) -> None:
+        """Initialize an interactor, optionally limiting the number of queries and the total time."""
+        self.query_limit = query_limit
+        self.time_limit = time_limit
+
+    def start(self) -> str:
+        """Return the input given to the contestant before the first query."""
+        return ""
+
+    @abc.abstractmethod
+    def respond(self, line: str) -> Optional[str]:
+        """Return the response to a line sent by the contestant, or None if it was the (correct) final answer.
+        Raise WrongAnswer if the line is invalid."""
+
+    @staticmethod
+    def parse_index(line: str, n: int) -> int:
+        """Return i from a query "? i" with 1 <= i <= n. Raise WrongAnswer if the query is invalid."""
+        kind, *args = line.split() or [""]
+        if kind != "?" or len(args) != 1 or not is_number(args[0]) or not 1 <= int(args[0]) <= n:
+            raise WrongAnswer(f"invalid query: {line}")
+        return int(args[0])
+
+    def run(self, cmd: List[str]) -> Result:
+        """Run the contestant's program (a command with arguments) against this interactor."""
+        return asyncio.run(self._interact(cmd))
+
+    async def _interact(self, cmd: List[str]) -> Result:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=1 << 24,  # maximum length of a line
+        )
+        query_cnt, times = 0, []
+        deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else None
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(deadline - time.perf_counter(), 0)
+
+        def result(verdict: str, message: str = "") -> Result:
+            if proc.returncode is None:
+                proc.kill()
+            return Result(verdict, message, query_cnt, times)
+
+        try:
+            first = self.start()
+            if first:
+                proc.stdin.write((first + "\n").encode())
+            while True:
+                try:
+                    # a contestant that does not read its input makes the pipe (and drain) block
+                    await asyncio.wait_for(proc.stdin.drain(), remaining())
+                except asyncio.TimeoutError:
+                    return result("TLE")
+                sent = time.perf_counter()
+                try:
+                    raw = await asyncio.wait_for(proc.stdout.readline(), remaining())
+                except asyncio.TimeoutError:
+                    return result("TLE")
+                except ValueError:
+                    return result("WA", "line too long")
+                times.append(time.perf_counter() - sent)
+                if not raw:
+                    # the contestant may close its output and keep running
+                    try:
+                        await asyncio.wait_for(proc.wait(), remaining())
+                    except asyncio.TimeoutError:
+                        return result("TLE")
+                    return result("RE", f"exit code {proc.returncode} before the final answer")
+                try:
+                    response = self.respond(raw.decode().strip())
+                except UnicodeDecodeError:
+                    return result("WA", "line is not valid UTF-8")
+                except WrongAnswer as e:
+                    return result("WA", str(e))
+                if response is None:
+                    return result("OK")
+                query_cnt += 1
+                if self.query_limit is not None and query_cnt > self.query_limit:
+                    return result("QLE")
+                proc.stdin.write((response + "\n").encode())
+        except (BrokenPipeError, ConnectionResetError):
+            try:
+                await asyncio.wait_for(proc.wait(), remaining())
+            except asyncio.TimeoutError:
+                return result("TLE")
+            return result("RE", f"exit code {proc.returncode}")
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+
+
+class PermInteractor(Interactor):
+    """Hidden permutation of size n. Query "? i" returns p_i, the final answer is "! p_1 p_2 ... p_n"."""
+
+    def __init__(self, n: int, query_limit: Optional[int] = None, time_limit: Optional[float] = None) -> None:
+        super().__init__(query_limit, time_limit)
+        self.n = n
+        self.p = sequences.perm(n)
+
+    def start(self) -> str:
+        return str(self.n)
+
+    def respond(self, line: str) -> Optional[str]:
+        kind, *args = line.split() or [""]
+        if kind == "!":
+            if args != [str(x) for x in self.p]:
+                raise WrongAnswer("wrong permutation")
+            return None
+        return str(self.p[self.parse_index(line, self.n) - 1])
+
+
+class StringInteractor(Interactor):
+    """Hidden random string of given length. Query "? i" returns the i-th character (1-indexed),
+    the final answer is "! s"."""
+
+    def __init__(
+        self, len: int, alpha: Optional[str] = None, query_limit: Optional[int] = None, time_limit: Optional[float] = None
+    ) -> None:
+        super().__init__(query_limit, time_limit)
+        self.s = string.String(len, alpha) if alpha else string.String(len)
+
+    def start(self) -> str:
+        return str(self.s.len)
+
+    def respond(self, line: str) -> Optional[str]:
+        kind, *args = line.split() or [""]
+        if kind == "!":
+            if args != [self.s.s]:
+                raise WrongAnswer("wrong string")
+            return None
+        return self.s.s[self.parse_index(line, self.s.len) - 1]
+
+
+class TreeInteractor(Interactor):
+    """Hidden random tree with n vertices. Query "? v" returns the degree of v followed by its neighbours,
+    the final answer is "! u_1 v_1 u_2 v_2 ... u_{n-1} v_{n-1}" (the edges in any order)."""
+
+    def __init__(self, n: int, query_limit: Optional[int] = None, time_limit: Optional[float] = None) -> None:
+        super().__init__(query_limit, time_limit)
+        self.n = n
+        tree = graph.random_tree(n)
+        self.adj = [[] for _ in range(n + 1)]
+        for v in range(1, n + 1):
+            for edge in tree.edges[v]:
+                self.adj[tree.perm[edge.u]].append(tree.perm[edge.v])
+        self.edges = set((u, v) for u in range(1, n + 1) for v in self.adj[u] if u < v)
+
+    def start(self) -> str:
+        return str(self.n)
+
+    def respond(self, line: str) -> Optional[str]:
+        kind, *args = line.split() or [""]
+        if kind == "!":
+            if len(args) != 2 * (self.n - 1) or not all(is_number(x) for x in args):
+                raise WrongAnswer("wrong number of edges")
+            ends = list(map(int, args))
+            edges = set((min(u, v), max(u, v)) for u, v in zip(ends[::2], ends[1::2]))
+            if edges != self.edges:
+                raise WrongAnswer("wrong tree")
+            return None
+        neighbours = self.adj[self.parse_index(line, self.n)]
+        return " ".join(map(str, [len(neighbours)] + neighbours))
@@ -2,63 +2,182 @@
 Generate numbers with desired properties
 """
 
+import functools
+import itertools
 import math
 import random
+from typing import Callable, Dict, Tuple
 import radge.utils as utils
 
+SMALL_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+TRIAL_PRIMES = SMALL_PRIMES + [41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+# Miller-Rabin bases that are deterministic for all n < 2^64 (Sinclair)
+BASES_64 = [2, 325, 9375, 28178, 450775, 9780504, 1795265022]
+# ranges with fewer candidates than this are scanned exhaustively (and cached)
+SCAN_LIMIT = 10**4
+
 
 def mpow(a: int, b: int, m: int) -> int:
     """Modular exponentiation."""
-    res = 1
-    while b > 0:
-        if b % 2 == 1:
-            res = (res * a) % m
-        a = (a * a) % m
-        b //= 2
+    return pow(a, b, m)
 
-    return res
 
+def miller_rabin(n: int) -> bool:
+    """Miller-Rabin primality test. Deterministic for n < 3.3 * 10^24."""
+    if n < 2:
+        return False
+    for p in TRIAL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < TRIAL_PRIMES[-1] ** 2:
+        return True
 
-def random_prime(max_n: int) -> int:
-    """Generate a random prime number not greater than max_n."""
+    s = 0
+    q = n - 1
+    while q % 2 == 0:
+        q //= 2
+        s += 1
 
-    def miller_rabin(n: int) -> bool:
-        """Miller-Rabin primality test."""
+    for a in BASES_64 if n < 1 << 64 else SMALL_PRIMES:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, q, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(1, s):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
 
-        def is_composite(n: int, a: int, q: int, s: int) -> bool:
-            x = mpow(a, q, n)
-            if x == 1 or x == n - 1:
-                return False
-            for _ in range(1, s):
-                x = (x * x) % n
-                if x == n - 1:
-                    return False
+    return True
 
-            return True
 
-        if n == 2 or n == 3:
-            return True
+def is_safe_prime(n: int) -> bool:
+    """Check if n is a safe prime, i.e. both n and (n - 1) / 2 are primes."""
+    return n % 2 == 1 and miller_rabin((n - 1) // 2) and miller_rabin(n)
 
-        s = 0
-        q = n - 1
-        while q % 2 == 0:
-            q //= 2
-            s += 1
 
-        for a in [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]:
-            if n == a:
-                return True
-            if is_composite(n, a, q, s):
-                return False
+def is_twin_prime(n: int) -> bool:
+    """Check if n and n + 2 are both primes."""
+    return miller_rabin(n) and miller_rabin(n + 2)
 
-        return True
 
+@functools.lru_cache(maxsize=128)
+def _scan(lo: int, hi: int, mult: int, add: int, test: Callable[[int], bool]) -> Tuple[int, ...]:
+    """Return all numbers mult * c + add for lo <= c <= hi that pass the test."""
+    return tuple(mult * c + add for c in range(lo, hi + 1) if test(mult * c + add))
+
+
+def _random_of_form(lo: int, hi: int, mult: int, add: int, test: Callable[[int], bool]) -> int:
+    """Return a uniformly random number mult * c + add for lo <= c <= hi that passes the test."""
     random.seed(utils.SEED)
-    bound, iters = 10 * int(math.log(max_n)), 0
-    while iters < bound:
-        n = random.randint(2, max_n)
-        if miller_rabin(n):
+    if hi - lo < SCAN_LIMIT:
+        found = _scan(lo, hi, mult, add, test)
+        if not found:
+            raise ValueError("There are no primes of the requested form in the given range.")
+        return random.choice(found)
+    # about 4 times the expected number of draws for the sparsest forms (twin and safe primes)
+    for _ in range(min(4 * (mult * hi + add).bit_length() ** 2, hi - lo + 1)):
+        n = mult * random.randint(lo, hi) + add
+        if test(n):
             return n
-        iters += 1
+    # the range may have no matches at all, so scan it (cyclically, from a random point)
+    start = random.randint(lo, hi)
+    for c in itertools.chain(range(start, hi + 1), range(lo, start)):
+        if test(mult * c + add):
+            return mult * c + add
+    raise ValueError("There are no primes of the requested form in the given range.")
+
+
+def random_prime(max_n: int, min_n: int = 2) -> int:
+    """Generate a uniformly random prime number p such that min_n <= p <= max_n."""
+    return _random_of_form(max(min_n, 2), max_n, 1, 0, miller_rabin)
+
+
+def random_ntt_prime(k: int, max_n: int, min_n: int = 2) -> int:
+    """Generate a random prime p = c * 2^k + 1 such that min_n <= p <= max_n
+    (suitable for a number-theoretic transform of length up to 2^k)."""
+    step = 1 << k
+    return _random_of_form(max(1, -(-(min_n - 1) // step)), (max_n - 1) // step, step, 1, miller_rabin)
+
+
+def random_safe_prime(max_n: int, min_n: int = 2) -> int:
+    """Generate a random safe prime p = 2q + 1 (q is a prime too) such that min_n <= p <= max_n."""
+    return _random_of_form(max(2, min_n // 2), (max_n - 1) // 2, 2, 1, is_safe_prime)
+
+
+def random_twin_primes(max_n: int, min_n: int = 2) -> Tuple[int, int]:
+    """Generate a random pair of twin primes (p, p + 2) such that min_n <= p < p + 2 <= max_n."""
+    p = _random_of_form(max(min_n, 2), max_n - 2, 1, 0, is_twin_prime)
+    return p, p + 2
+
+
+def random_factored(max_n: int) -> Tuple[int, Dict[int, int]]:
+    """Return a uniformly random integer 1 <= n <= max_n together with its prime factorisation
+    (a dict mapping each prime to its exponent), without factoring n (Kalai's algorithm)."""
+    if max_n < 1:
+        raise ValueError("max_n must be at least 1.")
+    random.seed(utils.SEED)
+    while True:
+        # descending sequence max_n >= s_1 >= s_2 >= ... >= 1, the primes in it form the candidate
+        factors, r, s = {}, 1, max_n
+        while s > 1:
+            s = random.randint(1, s)
+            if miller_rabin(s):
+                factors[s] = factors.get(s, 0) + 1
+                r *= s
+                if r > max_n:
+                    break
+        if r <= max_n and random.randint(1, max_n) <= r:
+            return r, factors
+
+
+def most_divisors(max_n: int) -> Tuple[int, Dict[int, int]]:
+    """Return the smallest number 1 <= n <= max_n with the greatest number of divisors,
+    together with its prime factorisation."""
+    if max_n < 1:
+        raise ValueError("max_n must be at least 1.")
+    primes = []
+    p, prod = 2, 1
+    while prod * p <= max_n:  # only the first few primes can appear in the answer
+        if miller_rabin(p):
+            primes.append(p)
+            prod *= p
+        p += 1
+
+    best = [1, 1, {}]  # number, divisor count, factorisation
+    exps = []
+
+    def search(i: int, n: int, cnt: int, max_exp: int) -> None:
+        if cnt > best[1] or (cnt == best[1] and n < best[0]):
+            best[0], best[1] = n, cnt
+            best[2] = {primes[j]: e for j, e in enumerate(exps)}
+        if i == len(primes):
+            return
+        e = 0
+        # exponents of consecutive primes are non-increasing in the optimal number
+        while e < max_exp and n * primes[i] <= max_n:
+            n *= primes[i]
+            e += 1
+            exps.append(e)
+            search(i + 1, n, cnt * (e + 1), e)
+            exps.pop()
+
+    search(0, 1, 1, int(math.log2(max_n)) + 1)
+
+    return best[0], best[2]
+
+
+def random_semiprime(max_n: int) -> Tuple[int, int, int]:
+    """Return a random number n = p * q <= max_n, where p <= q are primes of similar magnitude
+    (both close to sqrt(max_n)), as a tuple (n, p, q)."""
+    if max_n < 4:
+        raise ValueError("max_n must be at least 4.")
+    root = math.isqrt(max_n)
+    p = random_prime(root, max(2, root // 2))
+    q = random_prime(max_n // p, p)
 
-    return 2
+    return p * q, p, q
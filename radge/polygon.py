@@ -1,5 +1,5 @@
 """
-Generate convex polygons.
+Generate convex and simple polygons, and point sets in general position.
 """
 
 from __future__ import annotations
@@ -7,6 +7,7 @@ import math
 import random
 from typing import List
 
+import radge.numbers as numbers
 import radge.utils as utils
 
 
@@ -95,3 +96,76 @@ def random_convex(n: int) -> List[Vector]:
     lower.pop()
 
     return lower + upper
+
+
+def random_general_position(n: int, no_concyclic: bool = False) -> List[Vector]:
+    """Return n distinct points with integer coords, no three of which are collinear
+    (and, optionally, no four of which lie on a common circle).
+    The points lie on a random parabola y = a * x^2 + c taken modulo a prime p, which
+    guarantees both properties without checking any pairs or triples of points."""
+    span = 2 * utils.MAX_COORD + 1
+    # four points on the parabola are concyclic only if their x's sum to 0 mod p
+    need = 4 * n + 1 if no_concyclic else n
+    smallest = max(need, 2)
+    while not numbers.miller_rabin(smallest):
+        smallest += 1
+    if smallest > span:
+        raise ValueError(
+            f"MAX_COORD must be at least {smallest // 2} to fit {n} points in general position."
+        )
+    random.seed(utils.SEED)
+    p = numbers.random_prime(span, need)
+    xs = random.sample(range(1, (p - 1) // 4 + 1) if no_concyclic else range(p), n)
+    a, c = random.randint(1, p - 1), random.randint(0, p - 1)
+    flip_x, flip_y, swap = random.choice([-1, 1]), random.choice([-1, 1]), random.randint(0, 1)
+
+    points = []
+    for x in xs:
+        # reflections and swapping the axes preserve lines and circles
+        u, v = flip_x * (x - p // 2), flip_y * ((a * x * x + c) % p - p // 2)
+        points.append(Vector(v, u) if swap else Vector(u, v))
+
+    return points
+
+
+def random_simple(n: int) -> List[Vector]:
+    """Return a random simple (possibly non-convex) polygon with n vertices. Vertices have integer coords.
+    Uses the space partitioning heuristic on a point set in general position,
+    so MAX_COORD must be at least about n / 2 (see utils.max_coord)."""
+    points = random_general_position(n)
+    if n <= 3:
+        return points
+    # points are shuffled already, so the splitting segment is random
+    a, b = points[0], points[1]
+    left = [point for point in points[2:] if point.orient(a, b) > 0]
+    right = [point for point in points[2:] if point.orient(a, b) < 0]
+
+    # split points are picked on the segment pq with this denominator
+    DENOM = 1 << 20
+    ret = []
+    # either a single point to output or a chain p -> q to be built through all the points in a list
+    stack = [(b, a, right), b, (a, b, left), a]
+    while stack:
+        task = stack.pop()
+        if isinstance(task, Vector):
+            ret.append(task)
+            continue
+        p, q, inner = task
+        if len(inner) <= 1:
+            ret += inner
+            continue
+        r = inner[random.randrange(len(inner))]
+        while True:
+            # the line through r and a random point s on pq, everything scaled by DENOM
+            k = random.randint(1, DENOM - 1)
+            s = Vector(p.x * (DENOM - k) + q.x * k, p.y * (DENOM - k) + q.y * k)
+            d = s - Vector(r.x * DENOM, r.y * DENOM)
+            sides = [d.cross(point - r) for point in inner]
+            if all(side != 0 or point is r for side, point in zip(sides, inner)):
+                break
+        p_side = d.cross(p - r) > 0
+        near_p = [point for side, point in zip(sides, inner) if point is not r and (side > 0) == p_side]
+        near_q = [point for side, point in zip(sides, inner) if point is not r and (side > 0) != p_side]
+        stack += [(r, q, near_q), r, (p, r, near_p)]
+
+    return ret
@@ -17,3 +17,9 @@ def seed(seed: int) -> None:
     """Set global RNG seed."""
     global SEED
     SEED = seed
+
+
+def max_coord(max_coord: int) -> None:
+    """Set the maximum absolute value of generated coordinates."""
+    global MAX_COORD
+    MAX_COORD = max_coord
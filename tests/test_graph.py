@@ -1,9 +1,22 @@
+import itertools
 import random
 import unittest
 
+import radge.utils as utils
 from radge.graph import *
 
 
+def edge_set(graph):
+    """Return the set of (unordered) edges of an undirected graph, checking that it is simple."""
+    ret = set()
+    for v in range(1, graph.vertex_cnt + 1):
+        for edge in graph.edges[v]:
+            if edge.u < edge.v:
+                ret.add((edge.u, edge.v))
+    assert len(ret) == graph.edge_cnt
+    return ret
+
+
 class TestTree(unittest.TestCase):
     def test_is_tree(self):
         """Test if the generated graph is a tree."""
@@ -85,5 +98,196 @@ class TestTree(unittest.TestCase):
             self.assertTrue(all(vis[1:]))
 
 
+class TestGeometricGraph(unittest.TestCase):
+    def test_grid(self):
+        """Test if the grid graph has the right edges."""
+        for rows in range(1, 10):
+            for cols in range(1, 10):
+                graph = grid_graph(rows, cols)
+                self.assertTrue(graph.edge_cnt == rows * (cols - 1) + cols * (rows - 1))
+                for u, v in edge_set(graph):
+                    (ux, uy), (vx, vy) = divmod(u - 1, cols), divmod(v - 1, cols)
+                    self.assertTrue(abs(ux - vx) + abs(uy - vy) == 1)
+
+    def test_unit_disk(self):
+        """Test the unit disk graph against a brute force."""
+        TESTS = 100
+        MAX_N = 100
+        for i in range(TESTS):
+            random.seed(i)
+            n = random.randint(1, MAX_N)
+            points = [Vector(random.randint(-20, 20), random.randint(-20, 20)) for _ in range(n)]
+            radius = random.randint(0, 15)
+            graph = unit_disk_graph(n, radius, points=points)
+            expected = set((u + 1, v + 1) for u in range(n) for v in range(u + 1, n)
+                           if (points[u] - points[v]).norm() ** 2 <= radius**2 + 1e-9)
+            self.assertTrue(edge_set(graph) == expected)
+
+    def test_knn(self):
+        """Test if every vertex is connected to its k nearest points."""
+        TESTS = 100
+        MAX_N = 100
+        for i in range(TESTS):
+            random.seed(i)
+            n = random.randint(2, MAX_N)
+            points = [Vector(random.randint(-50, 50), random.randint(-50, 50)) for _ in range(n)]
+            k = random.randint(1, n - 1)
+            self.assertRaises(ValueError, knn_graph, n, 0, points=points)
+            edges = edge_set(knn_graph(n, k, points=points))
+
+            def dist(u, v):
+                return (points[u].x - points[v].x) ** 2 + (points[u].y - points[v].y) ** 2
+
+            kth = [sorted(dist(u, v) for v in range(n) if v != u)[k - 1] for u in range(n)]
+            adj = [set() for _ in range(n)]
+            for u, v in edges:
+                adj[u - 1].add(v - 1)
+                adj[v - 1].add(u - 1)
+                self.assertTrue(dist(u - 1, v - 1) <= max(kth[u - 1], kth[v - 1]))
+            for u in range(n):
+                self.assertTrue(sum(dist(u, v) <= kth[u] for v in adj[u]) >= k)
+
+    def test_knn_clustered(self):
+        """Test k nearest neighbours on clustered points, duplicates and far outliers."""
+        TESTS = 20
+        MAX_N = 300
+        for i in range(TESTS):
+            random.seed(i)
+            n = random.randint(2, MAX_N)
+            centers = [(random.randint(-10**9, 10**9), random.randint(-10**9, 10**9)) for _ in range(3)]
+            points = []
+            for _ in range(n):
+                cx, cy = random.choice(centers)
+                points.append(Vector(cx + random.randint(-2, 2), cy + random.randint(-2, 2)))
+            k = random.randint(1, n - 1)
+            edges = edge_set(knn_graph(n, k, points=points))
+
+            def dist(u, v):
+                return (points[u].x - points[v].x) ** 2 + (points[u].y - points[v].y) ** 2
+
+            kth = [sorted(dist(u, v) for v in range(n) if v != u)[k - 1] for u in range(n)]
+            deg_within = [0] * n
+            for u, v in edges:
+                self.assertTrue(dist(u - 1, v - 1) <= max(kth[u - 1], kth[v - 1]))
+                deg_within[u - 1] += dist(u - 1, v - 1) <= kth[u - 1]
+                deg_within[v - 1] += dist(u - 1, v - 1) <= kth[v - 1]
+            self.assertTrue(all(d >= k for d in deg_within))
+        # all points equal: every vertex still gets k neighbours
+        graph = knn_graph(1000, 3, points=[Vector(7, 7)] * 1000)
+        self.assertTrue(all(len(graph.edges[v]) >= 3 for v in range(1, 1001)))
+
+    def test_default_points(self):
+        """Test if random points rarely coincide with the default MAX_COORD."""
+        graph = unit_disk_graph(2000, 0)
+        self.assertTrue(graph.edge_cnt < 20)
+
+    def test_planar(self):
+        """Test if the planar graph is a connected subgraph of a triangulated grid."""
+        TESTS = 100
+        MAX_N = 500
+        for i in range(TESTS):
+            utils.seed(i)
+            n = random.randint(3, MAX_N)
+            self.assertRaises(ValueError, planar_graph, n, 3 * n - 5)
+            m = random.randint(n - 1, 2 * n - 2 * math.isqrt(n))
+            graph = planar_graph(n, m, connected=True)
+            edges = edge_set(graph)
+            self.assertTrue(len(edges) == m)
+
+            # vertex v (before relabelling) lies in row (v - 1) // cols and column (v - 1) % cols
+            cols = max(1, math.isqrt(n))
+            diagonal_cells = set()
+            for u, v in edges:
+                (ur, uc), (vr, vc) = divmod(u - 1, cols), divmod(v - 1, cols)
+                self.assertTrue(abs(ur - vr) <= 1 and abs(uc - vc) <= 1)
+                if ur != vr and uc != vc:
+                    cell = (min(ur, vr), min(uc, vc))
+                    self.assertFalse(cell in diagonal_cells)  # the two diagonals of a cell would cross
+                    diagonal_cells.add(cell)
+
+            vis = [False] * (graph.vertex_cnt + 1)
+            stack = [1]
+            vis[1] = True
+            while stack:
+                v = stack.pop()
+                for edge in graph.edges[v]:
+                    if not vis[edge.v]:
+                        vis[edge.v] = True
+                        stack.append(edge.v)
+            self.assertTrue(all(vis[1:]))
+
+
+class TestDegreeSequence(unittest.TestCase):
+    def test_is_graphical(self):
+        """Test the Erdos-Gallai check against a brute force over all small graphs."""
+        for n in range(1, 6):
+            pairs = [(u, v) for u in range(n) for v in range(u + 1, n)]
+            graphical = set()
+            for mask in range(1 << len(pairs)):
+                deg = [0] * n
+                for i, (u, v) in enumerate(pairs):
+                    if mask >> i & 1:
+                        deg[u] += 1
+                        deg[v] += 1
+                graphical.add(tuple(sorted(deg)))
+            for degrees in itertools.product(range(n + 1), repeat=n):
+                self.assertTrue(is_graphical(list(degrees)) == (tuple(sorted(degrees)) in graphical))
+
+    def test_regular(self):
+        """Test if the generated graph is simple and regular."""
+        TESTS = 100
+        MAX_N = 200
+        for i in range(TESTS):
+            utils.seed(i)
+            n = random.randint(1, MAX_N)
+            k = random.randint(0, n - 1)
+            if n * k % 2 == 1:
+                self.assertRaises(ValueError, regular_graph, n, k)
+                k -= 1
+            graph = regular_graph(n, k)
+            edges = edge_set(graph)
+            self.assertTrue(len(edges) == n * k // 2)
+            self.assertTrue(all(u != v for u, v in edges))
+            self.assertTrue(all(len(graph.edges[v]) == k for v in range(1, n + 1)))
+
+    def test_power_law(self):
+        """Test if the generated graph is simple and respects the maximum degree."""
+        TESTS = 100
+        MAX_N = 500
+        for i in range(TESTS):
+            utils.seed(i)
+            n = random.randint(2, MAX_N)
+            max_degree = random.randint(1, n - 1)
+            graph = power_law_graph(n, max_degree=max_degree)
+            edges = edge_set(graph)
+            self.assertTrue(all(u != v for u, v in edges))
+            self.assertTrue(all(len(graph.edges[v]) <= max_degree for v in range(1, n + 1)))
+        self.assertTrue(power_law_graph(1).edge_cnt == 0)
+
+    def test_not_graphical(self):
+        """Test if sequences without a simple graph are rejected."""
+        for degrees in [[3, 3, 1, 1], [1], [1, 1, 1], [2, 2], [-1, 1, 0]]:
+            self.assertRaises(ValueError, degree_sequence_graph, degrees)
+
+    def test_degree_sequence_exact(self):
+        """Test if the graph built from a given sequence has exactly these degrees."""
+        TESTS = 100
+        MAX_N = 200
+        for i in range(TESTS):
+            utils.seed(i)
+            n = random.randint(1, MAX_N)
+            degrees = [random.randint(0, n - 1) for _ in range(n)]
+            if not is_graphical(degrees):
+                continue
+            graph = degree_sequence_graph(degrees)
+            edges = edge_set(graph)
+            deg = [0] * n
+            for u, v in edges:
+                self.assertTrue(u != v)
+                deg[u - 1] += 1
+                deg[v - 1] += 1
+            self.assertTrue(deg == degrees)
+
+
 if __name__ == "__main__":
     unittest.main(failfast=True)
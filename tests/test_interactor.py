@@ -0,0 +1,147 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import radge.utils as utils
+from radge.interactor import *
+
+PERM_SOLUTION = """
+n = int(input())
+p = []
+for i in range(1, n + 1):
+    print("?", i, flush=True)
+    p.append(input())
+print("!", *p, flush=True)
+"""
+
+STRING_SOLUTION = """
+n = int(input())
+s = ""
+for i in range(1, n + 1):
+    print("?", i, flush=True)
+    s += input()
+print("!", s, flush=True)
+"""
+
+TREE_SOLUTION = """
+n = int(input())
+edges = []
+for v in range(1, n + 1):
+    print("?", v, flush=True)
+    deg, *adj = map(int, input().split())
+    edges += [(v, u) for u in adj if v < u]
+print("!", *(x for edge in edges for x in edge), flush=True)
+"""
+
+WRONG_SOLUTION = """
+n = int(input())
+print("!", *range(1, n + 1), flush=True)
+"""
+
+SLOW_SOLUTION = """
+import time
+n = int(input())
+time.sleep(5)
+"""
+
+FLOODING_SOLUTION = """
+while True:
+    print("? 1")
+"""
+
+CLOSING_SOLUTION = """
+import os
+import time
+n = int(input())
+os.close(1)
+time.sleep(4)
+"""
+
+SUPERSCRIPT_SOLUTION = """
+n = int(input())
+print("? \u00b2", flush=True)
+"""
+
+BAD_BYTES_SOLUTION = """
+import sys
+n = int(input())
+sys.stdout.buffer.write(b"\\xff\\n")
+sys.stdout.flush()
+"""
+
+LONG_LINE_SOLUTION = """
+import sys
+n = int(input())
+sys.stdout.write("?" * (1 << 25) + "\\n")
+sys.stdout.flush()
+"""
+
+CRASHING_SOLUTION = """
+n = int(input())
+exit(3)
+"""
+
+
+class FloodInteractor(Interactor):
+    """Answers every query with a long line, so that the pipe fills up if the contestant doesn't read it."""
+
+    def respond(self, line: str) -> Optional[str]:
+        return "x" * 4096
+
+
+class TestInteractor(unittest.TestCase):
+    def run_solution(self, interactor, source):
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+            f.write(source)
+        try:
+            return interactor.run([sys.executable, f.name])
+        finally:
+            os.unlink(f.name)
+
+    def test_solved(self):
+        """Test if correct solutions are accepted."""
+        N = 10**4
+        utils.seed(0)
+        for interactor, source in [
+            (PermInteractor(N, query_limit=N), PERM_SOLUTION),
+            (StringInteractor(N, query_limit=N), STRING_SOLUTION),
+            (TreeInteractor(N, query_limit=N), TREE_SOLUTION),
+        ]:
+            result = self.run_solution(interactor, source)
+            self.assertTrue(result.verdict == "OK", str(result))
+            self.assertTrue(result.query_cnt == N and len(result.times) == N + 1)
+
+    def test_rejected(self):
+        """Test if wrong, too slow and crashing solutions are rejected."""
+        utils.seed(0)
+        N = 100
+        self.assertTrue(self.run_solution(PermInteractor(N), WRONG_SOLUTION).verdict == "WA")
+        self.assertTrue(self.run_solution(PermInteractor(N, query_limit=N - 1), PERM_SOLUTION).verdict == "QLE")
+        self.assertTrue(self.run_solution(PermInteractor(N, time_limit=0.5), SLOW_SOLUTION).verdict == "TLE")
+        self.assertTrue(self.run_solution(PermInteractor(N), CRASHING_SOLUTION).verdict == "RE")
+        self.assertTrue(self.run_solution(FloodInteractor(time_limit=2), FLOODING_SOLUTION).verdict == "TLE")
+        self.assertTrue(self.run_solution(PermInteractor(N, time_limit=1), CLOSING_SOLUTION).verdict == "TLE")
+        self.assertTrue(self.run_solution(PermInteractor(N, time_limit=0), PERM_SOLUTION).verdict == "TLE")
+
+    def test_malformed(self):
+        """Test if malformed lines from the contestant are rejected instead of crashing the judge."""
+        utils.seed(0)
+        N = 100
+        for source in [SUPERSCRIPT_SOLUTION, BAD_BYTES_SOLUTION, LONG_LINE_SOLUTION]:
+            self.assertTrue(self.run_solution(PermInteractor(N), source).verdict == "WA")
+        self.assertRaises(WrongAnswer, Interactor.parse_index, "? \u00b2", N)
+        self.assertRaises(WrongAnswer, Interactor.parse_index, "? 0", N)
+        self.assertTrue(Interactor.parse_index("? 7", N) == 7)
+
+    def test_abstract(self):
+        """Test if an interactor without respond can't be created."""
+
+        class NoRespond(Interactor):
+            pass
+
+        self.assertRaises(TypeError, NoRespond)
+
+
+if __name__ == "__main__":
+    unittest.main(failfast=True)
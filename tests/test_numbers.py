@@ -1,12 +1,17 @@
 import math
 import unittest
 
+import radge.utils as utils
 from radge.numbers import *
 
 TESTS = 1000
 MAX_N = 1_000_000_000
 
 
+def is_prime(n: int) -> bool:
+    return n >= 2 and all(n % i != 0 for i in range(2, math.isqrt(n) + 1))
+
+
 class TestNumbers(unittest.TestCase):
     def test_random_prime(self):
         """Test if the generated number is a prime."""
@@ -16,6 +21,74 @@ class TestNumbers(unittest.TestCase):
             self.assertTrue(p >= 2 and p <= MAX_N)
             self.assertTrue(all(p % i != 0 for i in range(2, math.isqrt(p) + 1)))
 
+    def test_miller_rabin(self):
+        """Test the primality test against trial division and known large primes."""
+        for n in range(10**5):
+            self.assertTrue(miller_rabin(n) == is_prime(n))
+        self.assertTrue(miller_rabin(2**61 - 1) and miller_rabin(998244353))
+        self.assertFalse(miller_rabin(3825123056546413051))  # strong pseudoprime to bases 2..23
+        self.assertFalse(miller_rabin((2**61 - 1) * (2**31 - 1)))
+
+    def test_random_prime_range(self):
+        """Test if the generated prime lies in the requested range."""
+        for i in range(TESTS):
+            utils.seed(i)
+            lo = random.randint(2, 10**18)
+            hi = lo + random.randint(2000, 10**6)  # prime gaps below 2^64 are shorter
+            p = random_prime(hi, lo)
+            self.assertTrue(lo <= p <= hi and miller_rabin(p))
+
+    def test_structured_primes(self):
+        """Test NTT-friendly, safe and twin prime generators."""
+        for i in range(TESTS // 10):
+            utils.seed(i)
+            k = random.randint(1, 23)
+            p = random_ntt_prime(k, 10**18)
+            self.assertTrue(p <= 10**18 and (p - 1) % (1 << k) == 0 and miller_rabin(p))
+            p = random_safe_prime(10**18, 10**9)
+            self.assertTrue(10**9 <= p <= 10**18 and miller_rabin(p) and miller_rabin(p // 2))
+            p, q = random_twin_primes(10**18)
+            self.assertTrue(q == p + 2 and q <= 10**18 and miller_rabin(p) and miller_rabin(q))
+        self.assertTrue(random_ntt_prime(23, 10**9, 9 * 10**8) == 998244353)
+        self.assertTrue(random_twin_primes(5) == (3, 5))
+        self.assertRaises(ValueError, random_safe_prime, 22, 12)
+        self.assertRaises(ValueError, random_prime, 28, 24)
+        # large ranges without any matches
+        self.assertRaises(ValueError, random_twin_primes, 10**100 + 20000, 10**100)
+        self.assertRaises(ValueError, random_safe_prime, 10**100 + 20000, 10**100)
+
+    def test_random_factored(self):
+        """Test if the returned factorisation matches the generated number."""
+        for i in range(TESTS):
+            utils.seed(i)
+            max_n = random.randint(1, 10**18)
+            n, factors = random_factored(max_n)
+            self.assertTrue(1 <= n <= max_n)
+            self.assertTrue(math.prod(p**e for p, e in factors.items()) == n)
+            self.assertTrue(all(miller_rabin(p) for p in factors))
+
+    def test_most_divisors(self):
+        """Test the number with most divisors against a brute force."""
+        divs = [0] * 5001
+        for i in range(1, 5001):
+            for j in range(i, 5001, i):
+                divs[j] += 1
+        for max_n in range(1, 5001):
+            n, factors = most_divisors(max_n)
+            best = max(range(1, max_n + 1), key=lambda x: (divs[x], -x))
+            self.assertTrue(n == best)
+            self.assertTrue(math.prod(p**e for p, e in factors.items()) == n)
+        self.assertTrue(most_divisors(10**18)[0] == 897612484786617600)
+
+    def test_random_semiprime(self):
+        """Test if the generated number is a product of two primes."""
+        for i in range(TESTS):
+            utils.seed(i)
+            max_n = random.randint(4, MAX_N)
+            n, p, q = random_semiprime(max_n)
+            self.assertTrue(n == p * q and n <= max_n and p <= q)
+            self.assertTrue(is_prime(p) and is_prime(q))
+
 
 if __name__ == "__main__":
     unittest.main(failfast=True)
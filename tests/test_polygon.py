@@ -1,9 +1,28 @@
+import itertools
 import random
 import unittest
 
+import radge.utils as utils
 from radge.polygon import *
 
 
+def sgn(x):
+    return (x > 0) - (x < 0)
+
+
+def segments_intersect(a, b, c, d):
+    """Check if closed segments ab and cd have a common point."""
+    d1, d2 = sgn(a.orient(b, c)), sgn(a.orient(b, d))
+    d3, d4 = sgn(c.orient(d, a)), sgn(c.orient(d, b))
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        return True
+
+    def on_segment(p, q, r):
+        return p.orient(q, r) == 0 and min(p.x, q.x) <= r.x <= max(p.x, q.x) and min(p.y, q.y) <= r.y <= max(p.y, q.y)
+
+    return on_segment(a, b, c) or on_segment(a, b, d) or on_segment(c, d, a) or on_segment(c, d, b)
+
+
 class TestPolygon(unittest.TestCase):
     def test_convex(self):
         """Test if the generated polygon is convex."""
@@ -22,6 +41,61 @@ class TestPolygon(unittest.TestCase):
                 v = w
             self.assertTrue(min(cross_products) * max(cross_products) >= 0)
 
+    def test_simple(self):
+        """Test if the generated polygon has no self-intersections."""
+        TESTS = 100
+        MAX_N = 200
+        start_max_coord = utils.MAX_COORD
+        utils.max_coord(10**6)
+        for test in range(TESTS):
+            utils.seed(test)
+            n = random.randint(3, MAX_N)
+            poly = random_simple(n)
+            self.assertTrue(len(poly) == n)
+            for i in range(n):
+                for j in range(i + 2, n):
+                    if i == 0 and j == n - 1:
+                        continue  # adjacent edges
+                    a, b = poly[i], poly[(i + 1) % n]
+                    c, d = poly[j], poly[(j + 1) % n]
+                    self.assertFalse(segments_intersect(a, b, c, d))
+        utils.max_coord(start_max_coord)
+
+    def test_general_position(self):
+        """Test if no three points are collinear and no four points are concyclic."""
+        TESTS = 20
+        MAX_N = 30
+        start_max_coord = utils.MAX_COORD
+        for test in range(TESTS):
+            utils.seed(test)
+            utils.max_coord(random.randint(2 * MAX_N, 10**4))
+            n = random.randint(1, MAX_N)
+            points = random_general_position(n, no_concyclic=True)
+            self.assertTrue(all(abs(p.x) <= utils.MAX_COORD and abs(p.y) <= utils.MAX_COORD for p in points))
+            for a, b, c in itertools.combinations(points, 3):
+                self.assertTrue(a.orient(b, c) != 0)
+            for quad in itertools.combinations(points, 4):
+                a, b, c, d = (p - quad[0] for p in quad)
+                # lifting of b, c, d onto the paraboloid z = x^2 + y^2 is coplanar with a = 0
+                rows = [(p.x, p.y, p.x**2 + p.y**2) for p in (b, c, d)]
+                det = (rows[0][0] * (rows[1][1] * rows[2][2] - rows[1][2] * rows[2][1])
+                       - rows[0][1] * (rows[1][0] * rows[2][2] - rows[1][2] * rows[2][0])
+                       + rows[0][2] * (rows[1][0] * rows[2][1] - rows[1][1] * rows[2][0]))
+                self.assertTrue(det != 0)
+        utils.max_coord(start_max_coord)
+        self.assertRaises(ValueError, random_general_position, 2 * utils.MAX_COORD + 2)
+
+    def test_general_position_bound(self):
+        """Test if the generator works exactly up to the MAX_COORD bound given in its error message."""
+        start_max_coord = utils.MAX_COORD
+        # the smallest prime p >= n (or 4n + 1) has to fit in [-MAX_COORD, MAX_COORD]
+        for n, no_concyclic, bound in [(24, False, 14), (23, False, 11), (6, True, 14), (100, True, 200)]:
+            utils.max_coord(bound - 1)
+            self.assertRaises(ValueError, random_general_position, n, no_concyclic)
+            utils.max_coord(bound)
+            self.assertTrue(len(random_general_position(n, no_concyclic)) == n)
+        utils.max_coord(start_max_coord)
+
 
 if __name__ == "__main__":
     unittest.main(failfast=True)